@@ -21,16 +21,23 @@ class Localization:
         self.default_lang = default_lang
         self.current_lang = default_lang
         self.translations: Dict[str, str] = {}
+        self._loaded: Dict[str, Dict[str, str]] = {}  # Parsed tables, kept for switching back
         self._load_language(self.default_lang)
 
     def _load_language(self, lang: str):
-        """Loads a language file into memory."""
+        """Loads a language file into memory, or reuses it if it was loaded before."""
+        if lang in self._loaded:
+            self.translations = self._loaded[lang]
+            self.current_lang = lang
+            return
+
         self.translations = {}
         file_path = os.path.join(self.locale_dir, f"{lang}.json")
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 self.translations = json.load(f)
             self.current_lang = lang
+            self._loaded[lang] = self.translations
         except (FileNotFoundError, json.JSONDecodeError):
             # Fallback to default language if the selected one fails to load
             if lang != self.default_lang:
@@ -1,7 +1,14 @@
 import os
-from dotenv import load_dotenv, set_key, find_dotenv
+import threading
+from dotenv import load_dotenv, find_dotenv
+from dotenv.main import rewrite
+from dotenv.parser import parse_stream
 from typing import Optional
 
+# Settings are saved from the main thread and from worker threads; each save
+# rewrites the whole .env file, so saves must not interleave
+_save_lock = threading.Lock()
+
 class Settings:
     """Loads and provides access to application settings from a .env file."""
 
@@ -39,47 +46,79 @@ class Settings:
                      ui_catbox_anonymous: Optional[bool] = None,
                      ui_language: Optional[str] = None):
         """Update settings and save to .env file"""
-        env_path = find_dotenv() or ".env"
+        with _save_lock:
+            updates = {}
 
-        # Update instance variables and save to .env
-        if index_git_clone_url is not None:
-            self.INDEX_GIT_CLONE_URL = index_git_clone_url
-            set_key(env_path, "INDEX_GIT_CLONE_URL", index_git_clone_url or "")
+            # Update instance variables and collect the .env changes
+            if index_git_clone_url is not None:
+                self.INDEX_GIT_CLONE_URL = index_git_clone_url
+                updates["INDEX_GIT_CLONE_URL"] = index_git_clone_url or ""
 
-        if index_git_branch is not None:
-            self.INDEX_GIT_BRANCH = index_git_branch
-            set_key(env_path, "INDEX_GIT_BRANCH", index_git_branch or "")
+            if index_git_branch is not None:
+                self.INDEX_GIT_BRANCH = index_git_branch
+                updates["INDEX_GIT_BRANCH"] = index_git_branch or ""
 
-        if index_git_local_folder is not None:
-            self.INDEX_GIT_LOCAL_FOLDER = index_git_local_folder
-            set_key(env_path, "INDEX_GIT_LOCAL_FOLDER", index_git_local_folder or "")
+            if index_git_local_folder is not None:
+                self.INDEX_GIT_LOCAL_FOLDER = index_git_local_folder
+                updates["INDEX_GIT_LOCAL_FOLDER"] = index_git_local_folder or ""
 
-        if github_token_for_index is not None:
-            self.GITHUB_TOKEN_FOR_INDEX = github_token_for_index
-            set_key(env_path, "GITHUB_TOKEN_FOR_INDEX", github_token_for_index or "")
+            if github_token_for_index is not None:
+                self.GITHUB_TOKEN_FOR_INDEX = github_token_for_index
+                updates["GITHUB_TOKEN_FOR_INDEX"] = github_token_for_index or ""
 
-        if github_asset_repo is not None:
-            self.GITHUB_ASSET_REPO = github_asset_repo
-            set_key(env_path, "GITHUB_ASSET_REPO", github_asset_repo or "")
+            if github_asset_repo is not None:
+                self.GITHUB_ASSET_REPO = github_asset_repo
+                updates["GITHUB_ASSET_REPO"] = github_asset_repo or ""
 
-        if github_token_for_assets is not None:
-            self.GITHUB_TOKEN_FOR_ASSETS = github_token_for_assets
-            set_key(env_path, "GITHUB_TOKEN_FOR_ASSETS", github_token_for_assets or "")
+            if github_token_for_assets is not None:
+                self.GITHUB_TOKEN_FOR_ASSETS = github_token_for_assets
+                updates["GITHUB_TOKEN_FOR_ASSETS"] = github_token_for_assets or ""
 
-        if catbox_user_hash is not None:
-            self.CATBOX_USER_HASH = catbox_user_hash
-            set_key(env_path, "CATBOX_USER_HASH", catbox_user_hash or "")
+            if catbox_user_hash is not None:
+                self.CATBOX_USER_HASH = catbox_user_hash
+                updates["CATBOX_USER_HASH"] = catbox_user_hash or ""
+    
+            if ui_use_single_token is not None:
+                self.UI_USE_SINGLE_TOKEN = ui_use_single_token
+                updates["UI_USE_SINGLE_TOKEN"] = str(ui_use_single_token)
         
-        if ui_use_single_token is not None:
-            self.UI_USE_SINGLE_TOKEN = ui_use_single_token
-            set_key(env_path, "UI_USE_SINGLE_TOKEN", str(ui_use_single_token))
-            
-        if ui_catbox_anonymous is not None:
-            self.UI_CATBOX_ANONYMOUS = ui_catbox_anonymous
-            set_key(env_path, "UI_CATBOX_ANONYMOUS", str(ui_catbox_anonymous))
-
-        if ui_language is not None:
-            self.UI_LANGUAGE = ui_language
-            set_key(env_path, "UI_LANGUAGE", ui_language)
+            if ui_catbox_anonymous is not None:
+                self.UI_CATBOX_ANONYMOUS = ui_catbox_anonymous
+                updates["UI_CATBOX_ANONYMOUS"] = str(ui_catbox_anonymous)
+
+            if ui_language is not None:
+                self.UI_LANGUAGE = ui_language
+                updates["UI_LANGUAGE"] = ui_language
+
+            if updates:
+                _write_env(find_dotenv() or ".env", updates)
+
+def _env_line(key: str, value: str, export: bool) -> str:
+    """Formats a KEY='value' line exactly as dotenv's set_key writes it."""
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"{'export ' if export else ''}{key}='{escaped}'\n"
+
+def _write_env(env_path: str, updates: dict):
+    """Applies all updates to the .env file in one read and one atomic write, using dotenv's own parser."""
+    if not os.path.exists(env_path):
+        open(env_path, "a", encoding="utf-8").close()
+    written = set()
+    missing_newline = False
+    with rewrite(env_path, encoding="utf-8") as (source, dest):
+        for binding in parse_stream(source):
+            line = binding.original.string
+            if binding.key in updates:
+                # Every copy of a duplicated key is replaced, as set_key does
+                line = _env_line(binding.key, updates[binding.key], line.lstrip().startswith("export "))
+                written.add(binding.key)
+            dest.write(line)
+            missing_newline = not line.endswith("\n")
+        for key, value in updates.items():
+            if key not in written:
+                if missing_newline:
+                    dest.write("\n")
+                    missing_newline = False
+                dest.write(_env_line(key, value, False))
+
 # Create a single instance of the settings to be used throughout the application
 settings = Settings()
\ No newline at end of file
@@ -28,6 +28,7 @@ class ReleaseWorkflow:
         self.file_paths = file_paths
         self.asset_providers = asset_providers
         self.index_provider = index_provider
+        # Invoked from the thread running run(), so it must not touch Tk widgets itself
         self.status_callback = status_callback
         self.profiler = profiler
 
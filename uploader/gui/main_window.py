@@ -6,9 +6,10 @@ import threading
 from tkinter import filedialog
 from typing import Dict, List
 from tkinterdnd2 import DND_FILES
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config import settings
 from ..core.workflow import ReleaseWorkflow
@@ -16,7 +17,8 @@ from ..providers.base import AssetProvider, IndexProvider
 from ..providers.catbox import CatboxProvider
 from ..providers.github_git import GitHubGitProvider
 from ..providers.github_release import GitHubReleaseProvider
-from ..utils.logging import log_queue, log_history
+from ..utils.logging import log_queue, log_history, set_log_listener
+from ..utils.threads import DaemonThreadPool
 from shared.localization import init_translator, get_translator
 
 # Set up fly agaric theme
@@ -28,6 +30,21 @@ FLY_AGARIC_RED = "#A52A2A"
 FLY_AGARIC_WHITE = "#F9F6EE"
 FLY_AGARIC_BLACK = "#2C1810"
 
+# Number of paths inserted into the file list per main loop iteration
+FILE_LIST_RENDER_CHUNK = 2000
+# Maximum feedback messages applied per drain; the rest follow shortly after
+FEEDBACK_DRAIN_LIMIT = 500
+# Lines kept in the log textbox; older ones are trimmed to keep Tk text fast
+FEEDBACK_MAX_LINES = 5000
+
+# Shared widget styles
+SECTION_FRAME = {"fg_color": FLY_AGARIC_BLACK, "border_color": FLY_AGARIC_RED, "border_width": 2}
+PRIMARY_BUTTON = {"fg_color": FLY_AGARIC_RED, "hover_color": FLY_AGARIC_WHITE, "text_color": FLY_AGARIC_WHITE}
+SECONDARY_BUTTON = {"fg_color": FLY_AGARIC_BLACK, "hover_color": FLY_AGARIC_RED,
+                    "border_color": FLY_AGARIC_RED, "border_width": 2}
+INPUT_STYLE = {"fg_color": FLY_AGARIC_WHITE, "text_color": FLY_AGARIC_BLACK,
+               "border_color": FLY_AGARIC_RED, "border_width": 2}
+
 
 class NotesEditPopup(ctk.CTkToplevel):
     def __init__(self, master, current_notes, save_callback):
@@ -61,6 +78,8 @@ class NotesEditPopup(ctk.CTkToplevel):
 class App(ctk.CTkToplevel):
     def __init__(self, master=None):
         super().__init__(master)
+        # Stay hidden while the widgets are built so the layout is computed once
+        self.withdraw()
 
         # --- Localization ---
         self.translator = init_translator("uploader/locale", settings.UI_LANGUAGE)
@@ -79,41 +98,162 @@ class App(ctk.CTkToplevel):
         self.last_status_message = ""
 
         self.file_paths: List[str] = []
-        self.feedback_queue = queue.Queue()
+        self._file_paths_set = set() # Mirrors file_paths for O(1) membership tests
+        self._pending_render_idx = 0
+        self._render_after_id = None
+        self.feedback_queue = queue.SimpleQueue()
+        self._flush_pending = False # True while a feedback drain is scheduled
+        # Long-lived daemon workers for releases, refreshes and other background jobs.
+        # Two of them, so a refresh or an index save never queues behind a running release.
+        self._executor = DaemonThreadPool(max_workers=2, thread_name_prefix="background")
+        # Parallel manifest downloads for a refresh, kept alive between refreshes.
+        # Daemon workers, so a download stuck on a slow host cannot hold up exit.
+        self._manifest_pool = DaemonThreadPool(max_workers=10, thread_name_prefix="manifest")
+        # Shared HTTP session so manifest fetches reuse keep-alive connections
+        self._http_session = requests.Session()
+        self._http_session.mount("https://", HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+        ))
+        # Last manifest seen per URL with its ETag, so unchanged manifests are not downloaded again
+        self._manifest_cache: Dict[str, tuple] = {}
+
+        # Providers are built in the background; see _configure_providers
+        self._providers_generation = 0  # Only the newest build may install its providers
+        self._providers_build_lock = threading.Lock()  # Builds run one at a time, as they share the clone folder
+        self._providers_error = None  # Error of the last failed build, shown in the provider frame
+        self.index_provider: IndexProvider = None
+        self.asset_providers: List[AssetProvider] = []
+        self.provider_checkboxes: Dict[ctk.CTkCheckBox, AssetProvider] = {}
+        # Kept in sync by _on_provider_toggle so validation never reads the Tk variables
+        self._selected_providers_set = set()
+        self._any_provider_checked = False
+        self._last_valid_state = None # Last state applied to the release button
+        self._validate_after_id = None # Pending debounced validation
+        self._ui_enabled = True # Current state applied by _toggle_ui_elements
 
-        self._configure_providers()
-        self._create_widgets()
-        self._update_ui_text() # Set initial text
-        self._process_feedback_queue()
+        self.release_widgets = [] # To hold references to the widgets for each release
+        self.header_labels = []  # Initialize header labels list
+        self._no_releases_label = None
+        self._spare_release_rows = []  # Hidden table rows kept for reuse
+        self._releases_generation = 0  # Bumped on every table refill
 
-        # Load initial values from settings now that UI is ready
-        self._load_settings_from_env()
+        # Shared fonts, so each widget doesn't create its own Tk font
+        self._font_header = ctk.CTkFont(size=14, weight="bold")
+        self._font_body = ctk.CTkFont(size=12)
+        self._font_table_header = ctk.CTkFont(weight="bold")
+
+        self._create_widgets()
+        self._update_window_text() # Widgets are built translated; only the title and tab names need setting
+        self.update_idletasks()
+        self.deiconify()
+        self._configure_providers()
 
         # Handle window closing
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
 
         self.console_window = None
-        self.after(100, self._process_log_queue)
+        # Console output is drained when records arrive instead of on a timer
+        self._log_drain_pending = False
+        set_log_listener(self._on_log_record)
+        self._on_log_record()  # Pick up what was logged before the window existed
 
     def _configure_providers(self):
-        """Instantiates all configured providers."""
-        self.index_provider: IndexProvider = GitHubGitProvider(
-            token=settings.GITHUB_TOKEN_FOR_INDEX,
-            clone_url=settings.INDEX_GIT_CLONE_URL,
-            branch=settings.INDEX_GIT_BRANCH,
-            local_folder=settings.INDEX_GIT_LOCAL_FOLDER,
-        )
+        """Instantiates all configured providers in a background thread."""
+        self._providers_generation += 1
+        if self._providers_error is not None:
+            self._providers_error = None
+            self.providers_loading_label.configure(text=self._providers_status_text())
+        thread = threading.Thread(target=self._configure_providers_bg, args=(self._providers_generation,))
+        thread.daemon = True
+        thread.start()
 
-        self.asset_providers: List[AssetProvider] = []
-        if settings.GITHUB_ASSET_REPO and settings.GITHUB_TOKEN_FOR_ASSETS:
-            self.asset_providers.append(
-                GitHubReleaseProvider(
-                    token=settings.GITHUB_TOKEN_FOR_ASSETS,
-                    repo_slug=settings.GITHUB_ASSET_REPO,
+    def _configure_providers_bg(self, generation: int):
+        """Builds the providers off the main thread, as cloning the index repo can block."""
+        with self._providers_build_lock:
+            # A newer build was requested while this one waited; let that one run instead
+            if generation != self._providers_generation:
+                return
+            self._build_providers(generation)
+
+    def _build_providers(self, generation: int):
+        """Constructs the providers from the current settings and hands them to the main thread."""
+        try:
+            index_provider = GitHubGitProvider(
+                token=settings.GITHUB_TOKEN_FOR_INDEX,
+                clone_url=settings.INDEX_GIT_CLONE_URL,
+                branch=settings.INDEX_GIT_BRANCH,
+                local_folder=settings.INDEX_GIT_LOCAL_FOLDER,
+            )
+
+            asset_providers: List[AssetProvider] = []
+            if settings.GITHUB_ASSET_REPO and settings.GITHUB_TOKEN_FOR_ASSETS:
+                asset_providers.append(
+                    GitHubReleaseProvider(
+                        token=settings.GITHUB_TOKEN_FOR_ASSETS,
+                        repo_slug=settings.GITHUB_ASSET_REPO,
+                    )
                 )
+            # Catbox is always available, user_hash can be None
+            asset_providers.append(CatboxProvider(user_hash=settings.CATBOX_USER_HASH, session=self._http_session))
+        except Exception as e:
+            logging.error(f"Failed to configure providers: {e}", exc_info=True)
+            self._log_status(self.translator.get("error_failed_to_configure_providers", error=str(e)))
+            self.after(0, self._on_providers_failed, generation, str(e))
+            return
+
+        # Schedule the checkbox creation on the main thread
+        self.after(0, self._install_providers, generation, index_provider, asset_providers)
+
+    def _on_providers_failed(self, generation: int, error: str):
+        """Replaces the loading placeholder with the error of the newest build."""
+        if self.is_closing or generation != self._providers_generation:
+            return
+        self._providers_error = error
+        self.providers_loading_label.configure(text=self._providers_status_text())
+        self.providers_loading_label.pack(pady=5, padx=20, anchor="w")
+
+    def _providers_status_text(self) -> str:
+        """Text of the provider frame placeholder: loading, or the last build error."""
+        if self._providers_error is not None:
+            return self.translator.get("error_failed_to_configure_providers", error=self._providers_error)
+        return self.translator.get("loading_providers")
+
+    def _install_providers(self, generation: int, index_provider: IndexProvider, asset_providers: List[AssetProvider]):
+        """Swaps the loading placeholder for one checkbox per asset provider."""
+        # Providers from a superseded build would carry outdated settings
+        if self.is_closing or generation != self._providers_generation:
+            return
+
+        self.index_provider = index_provider
+        self.asset_providers = asset_providers
+
+        self.providers_loading_label.pack_forget()
+        for cb in self.provider_checkboxes:
+            cb.destroy()
+        self.provider_checkboxes.clear()
+        self._selected_providers_set.clear()
+        self._any_provider_checked = False
+
+        for provider in self.asset_providers:
+            var = ctk.BooleanVar(value=False)
+            cb = ctk.CTkCheckBox(
+                self.provider_frame,
+                state="normal" if self._ui_enabled else "disabled",
+                text=provider.get_name(),
+                variable=var,
+                onvalue=True,
+                offvalue=False,
+                font=self._font_body,
+                fg_color=FLY_AGARIC_RED,
+                hover_color=FLY_AGARIC_WHITE
             )
-        # Catbox is always available, user_hash can be None
-        self.asset_providers.append(CatboxProvider(user_hash=settings.CATBOX_USER_HASH))
+            cb.configure(command=lambda cb=cb: self._on_provider_toggle(cb))
+            cb.pack(pady=5, padx=20, anchor="w")
+            self.provider_checkboxes[cb] = provider
+
+        self._validate_inputs()
 
     def _create_widgets(self):
         """Creates and lays out all the GUI widgets with tab-based interface."""
@@ -135,14 +275,14 @@ class App(ctk.CTkToplevel):
         # Set up Upload tab
         self._create_upload_tab()
 
-        # Set up Manage Releases tab
-        self._create_manage_releases_tab()
-
-        # Set up Settings tab
-        self._create_settings_tab()
-
-        # Set up Info tab
-        self._create_info_tab()
+        # The other tabs are built on first selection, see _on_tab_selected
+        self._settings_built = False
+        self._tab_builders = {
+            "manage_releases": self._create_manage_releases_tab,
+            "settings": self._build_settings_tab,
+            "info": self._create_info_tab,
+        }
+        self.tabview.configure(command=self._on_tab_selected)
 
     def _create_upload_tab(self):
         """Creates the upload tab with all main functionality."""
@@ -153,49 +293,32 @@ class App(ctk.CTkToplevel):
         scrollable_frame.pack(fill="both", expand=True, padx=5, pady=5)
 
         # --- Asset Provider Selection ---
-        provider_frame = ctk.CTkFrame(scrollable_frame, fg_color=FLY_AGARIC_BLACK,
-                                    border_color=FLY_AGARIC_RED, border_width=2)
-        provider_frame.pack(pady=5, padx=10, fill="x")
-        self.provider_frame_label = ctk.CTkLabel(provider_frame, text=self.translator.get("asset_providers_label"),
-                    font=ctk.CTkFont(size=14, weight="bold"))
+        self.provider_frame = ctk.CTkFrame(scrollable_frame, **SECTION_FRAME)
+        self.provider_frame.pack(pady=5, padx=10, fill="x")
+        self.provider_frame_label = ctk.CTkLabel(self.provider_frame, text=self.translator.get("asset_providers_label"),
+                    font=self._font_header)
         self.provider_frame_label.pack(pady=5, padx=10, anchor="w")
 
-        self.provider_checkboxes: Dict[ctk.CTkCheckBox, AssetProvider] = {}
-        for provider in self.asset_providers:
-            var = ctk.StringVar()
-            cb = ctk.CTkCheckBox(
-                provider_frame,
-                text=provider.get_name(),
-                variable=var,
-                onvalue=provider.get_name(),
-                offvalue="",
-                command=self._validate_inputs,
-                font=ctk.CTkFont(size=12),
-                fg_color=FLY_AGARIC_RED,
-                hover_color=FLY_AGARIC_WHITE
-            )
-            cb.pack(pady=5, padx=20, anchor="w")
-            self.provider_checkboxes[cb] = provider
+        # Placeholder until _install_providers adds the provider checkboxes
+        self.providers_loading_label = ctk.CTkLabel(self.provider_frame, text=self.translator.get("loading_providers"),
+                    font=self._font_body, state="disabled")
+        self.providers_loading_label.pack(pady=5, padx=20, anchor="w")
 
         # --- File Input ---
-        file_frame = ctk.CTkFrame(scrollable_frame, fg_color=FLY_AGARIC_BLACK,
-                                border_color=FLY_AGARIC_RED, border_width=2)
+        file_frame = ctk.CTkFrame(scrollable_frame, **SECTION_FRAME)
         file_frame.pack(pady=5, padx=10, fill="both", expand=True)
         self.files_to_upload_label = ctk.CTkLabel(file_frame, text=self.translator.get("files_to_upload_label"),
-                    font=ctk.CTkFont(size=14, weight="bold"))
+                    font=self._font_header)
         self.files_to_upload_label.pack(pady=5, padx=10, anchor="w")
 
         self.file_list_textbox = ctk.CTkTextbox(
             file_frame,
             height=100,
             state="disabled",
-            fg_color=FLY_AGARIC_WHITE,
-            text_color=FLY_AGARIC_BLACK,
-            border_color=FLY_AGARIC_RED,
-            border_width=2
+            **INPUT_STYLE
         )
         self.file_list_textbox.pack(pady=5, padx=10, fill="both", expand=True)
-        self._update_file_list_display()  # Set initial placeholder
+        self._rebuild_file_list_display()  # Set initial placeholder
 
         # Enable drag and drop functionality
         self.file_list_textbox.drop_target_register(DND_FILES)
@@ -205,26 +328,20 @@ class App(ctk.CTkToplevel):
         btn_frame.pack(fill="x", padx=10, pady=5)
         self.browse_files_button = ctk.CTkButton(btn_frame, text=self.translator.get("browse_files_button"),
                      command=self._browse_files,
-                     fg_color=FLY_AGARIC_RED,
-                     hover_color=FLY_AGARIC_WHITE,
-                     text_color=FLY_AGARIC_WHITE)
+                     **PRIMARY_BUTTON)
         self.browse_files_button.pack(side="left")
         self.clear_button = ctk.CTkButton(btn_frame, text=self.translator.get("clear_button"),
                      command=self._clear_files,
-                     fg_color=FLY_AGARIC_BLACK,
-                     hover_color=FLY_AGARIC_RED,
-                     border_color=FLY_AGARIC_RED,
-                     border_width=2)
+                     **SECONDARY_BUTTON)
         self.clear_button.pack(side="left", padx=10)
 
 
         # --- Metadata Input ---
-        metadata_frame = ctk.CTkFrame(scrollable_frame, fg_color=FLY_AGARIC_BLACK,
-                                    border_color=FLY_AGARIC_RED, border_width=2)
+        metadata_frame = ctk.CTkFrame(scrollable_frame, **SECTION_FRAME)
         metadata_frame.pack(pady=5, padx=10, fill="x")
 
         self.release_version_label = ctk.CTkLabel(metadata_frame, text=self.translator.get("release_version_label"),
-                    font=ctk.CTkFont(size=14, weight="bold"))
+                    font=self._font_header)
         self.release_version_label.pack(pady=5, padx=10, anchor="w")
         self.version_entry = ctk.CTkEntry(
             metadata_frame,
@@ -234,7 +351,7 @@ class App(ctk.CTkToplevel):
             placeholder_text=self.translator.get("release_version_placeholder")
         )
         self.version_entry.pack(pady=5, padx=10, fill="x")
-        self.version_entry.bind("<KeyRelease>", self._validate_inputs)
+        self.version_entry.bind("<KeyRelease>", self._schedule_validation)
 
         self.profiler_checkbox = ctk.CTkCheckBox(
             metadata_frame,
@@ -248,28 +365,23 @@ class App(ctk.CTkToplevel):
         release_notes_frame.pack(fill="x", padx=10, pady=5)
         
         self.release_notes_label = ctk.CTkLabel(release_notes_frame, text=self.translator.get("release_notes_label"),
-                    font=ctk.CTkFont(size=14, weight="bold"))
+                    font=self._font_header)
         self.release_notes_label.pack(side="left")
 
         self.edit_in_new_window_button = ctk.CTkButton(release_notes_frame, text=self.translator.get("edit_in_new_window_button"),
                      command=self._open_upload_notes_popup,
-                     fg_color=FLY_AGARIC_BLACK,
-                     hover_color=FLY_AGARIC_RED,
-                     border_color=FLY_AGARIC_RED,
-                     border_width=2)
+                     **SECONDARY_BUTTON)
         self.edit_in_new_window_button.pack(side="right")
 
         self.notes_textbox = ctk.CTkTextbox(
             metadata_frame,
             height=100,
-            fg_color=FLY_AGARIC_WHITE,
-            text_color=FLY_AGARIC_BLACK,
-            border_color=FLY_AGARIC_RED,
-            border_width=2
+            **INPUT_STYLE
         )
         self.notes_textbox.pack(pady=5, padx=10, fill="x")
         self.notes_textbox.insert("1.0", self.NOTES_PLACEHOLDER)
         self.notes_textbox.configure(text_color="grey")
+        self._notes_is_placeholder = True
         self.notes_textbox.bind("<FocusIn>", self._on_notes_focus_in)
         self.notes_textbox.bind("<FocusOut>", self._on_notes_focus_out)
 
@@ -280,44 +392,43 @@ class App(ctk.CTkToplevel):
             execution_frame, text=self.translator.get("create_release_button"),
             state="disabled",
             command=self.start_release_process,
-            fg_color=FLY_AGARIC_RED,
-            hover_color=FLY_AGARIC_WHITE,
-            text_color=FLY_AGARIC_WHITE,
-            font=ctk.CTkFont(size=14, weight="bold")
+            **PRIMARY_BUTTON,
+            font=self._font_header
         )
         self.create_release_button.pack(pady=2, padx=10, anchor="e")
 
         # --- Progress Log ---
-        progress_frame = ctk.CTkFrame(scrollable_frame, fg_color=FLY_AGARIC_BLACK,
-                                    border_color=FLY_AGARIC_RED, border_width=2)
+        progress_frame = ctk.CTkFrame(scrollable_frame, **SECTION_FRAME)
         progress_frame.pack(pady=5, padx=10, fill="both", expand=True)
 
         log_header_frame = ctk.CTkFrame(progress_frame, fg_color="transparent")
         log_header_frame.pack(fill="x", padx=10, pady=5)
 
         self.log_label = ctk.CTkLabel(log_header_frame, text=self.translator.get("log_label"),
-                    font=ctk.CTkFont(size=14, weight="bold"))
+                    font=self._font_header)
         self.log_label.pack(side="left", anchor="w")
         
         self.open_in_new_window_button = ctk.CTkButton(log_header_frame, text=self.translator.get("open_in_new_window_button"),
                      command=self._open_console_window,
-                     fg_color=FLY_AGARIC_BLACK,
-                     hover_color=FLY_AGARIC_RED,
-                     border_color=FLY_AGARIC_RED,
-                     border_width=2)
+                     **SECONDARY_BUTTON)
         self.open_in_new_window_button.pack(side="right")
 
         self.feedback_textbox = ctk.CTkTextbox(
             progress_frame,
             state="disabled",
             height=100,  # Set a larger default height
-            fg_color=FLY_AGARIC_WHITE,
-            text_color=FLY_AGARIC_BLACK,
-            border_color=FLY_AGARIC_RED,
-            border_width=2
+            **INPUT_STYLE
         )
         self.feedback_textbox.pack(pady=5, padx=10, fill="both", expand=True)
 
+        # Widgets disabled while a release is running, besides the release button and providers
+        self._toggleable_widgets = [
+            self.version_entry,
+            self.notes_textbox,
+            self.browse_files_button,
+            self.clear_button,
+        ]
+
     def _create_manage_releases_tab(self):
         """Creates the tab for managing existing releases."""
         manage_tab = self.tabview.tab("manage_releases")
@@ -337,9 +448,7 @@ class App(ctk.CTkToplevel):
             action_frame,
             text=self.translator.get("refresh_releases_button"),
             command=self._start_fetch_releases,
-            fg_color=FLY_AGARIC_RED,
-            hover_color=FLY_AGARIC_WHITE,
-            text_color=FLY_AGARIC_WHITE
+            **PRIMARY_BUTTON
         )
         self.refresh_releases_button.pack(side="left")
         
@@ -348,10 +457,7 @@ class App(ctk.CTkToplevel):
             text=self.translator.get("save_changes_button"),
             command=self._save_release_changes,
             state="disabled",
-            fg_color=FLY_AGARIC_BLACK,
-            hover_color=FLY_AGARIC_RED,
-            border_color=FLY_AGARIC_RED,
-            border_width=2
+            **SECONDARY_BUTTON
         )
         self.save_changes_button.pack(side="right")
 
@@ -363,8 +469,25 @@ class App(ctk.CTkToplevel):
         )
         self.releases_scroll_frame.grid(row=1, column=0, sticky="nsew")
 
-        self.release_widgets = [] # To hold references to the widgets for each release
-        self.header_labels = []  # Initialize header labels list
+        # Configure grid columns for the table
+        self.releases_scroll_frame.grid_columnconfigure(0, weight=0, minsize=50)   # Checkbox
+        self.releases_scroll_frame.grid_columnconfigure(1, weight=0, minsize=50)   # Profiler
+        self.releases_scroll_frame.grid_columnconfigure(2, weight=1, minsize=100)  # Version
+        self.releases_scroll_frame.grid_columnconfigure(3, weight=2, minsize=150)  # Upload Date
+        self.releases_scroll_frame.grid_columnconfigure(4, weight=1, minsize=150)  # SHA
+        self.releases_scroll_frame.grid_columnconfigure(5, weight=3, minsize=200)  # Release Notes
+
+    def _on_tab_selected(self):
+        """Builds the selected tab if this is the first time it is shown."""
+        builder = self._tab_builders.pop(self.tabview.get(), None)
+        if builder is not None:
+            builder()
+
+    def _build_settings_tab(self):
+        """Builds the Settings tab and loads the current settings into it."""
+        self._settings_built = True
+        self._create_settings_tab()
+        self._load_settings_from_env()
 
     def _create_settings_tab(self):
         """Creates the settings tab with configuration options."""
@@ -379,54 +502,37 @@ class App(ctk.CTkToplevel):
         self.settings_widgets = {}
 
         # Index Configuration Section
-        index_frame = ctk.CTkFrame(scrollable_frame, fg_color=FLY_AGARIC_BLACK,
-                                  border_color=FLY_AGARIC_RED, border_width=2)
+        index_frame = ctk.CTkFrame(scrollable_frame, **SECTION_FRAME)
         index_frame.pack(pady=10, padx=10, fill="x")
 
         self.index_repo_config_label = ctk.CTkLabel(index_frame, text=self.translator.get("index_repo_config_label"),
-                    font=ctk.CTkFont(size=14, weight="bold"))
+                    font=self._font_header)
         self.index_repo_config_label.pack(pady=5, padx=10, anchor="w")
 
         # Clone URL
-        self.git_clone_url_label = ctk.CTkLabel(index_frame, text=self.translator.get("git_clone_url_label"))
-        self.git_clone_url_label.pack(pady=2, padx=10, anchor="w")
-        self.settings_widgets['index_git_clone_url'] = ctk.CTkEntry(
-            index_frame,
-            fg_color=FLY_AGARIC_WHITE,
-            text_color=FLY_AGARIC_BLACK,
+        self.git_clone_url_label = self._labeled_entry(
+            index_frame, self.translator.get("git_clone_url_label"), 'index_git_clone_url',
             placeholder_text="https://github.com/YourUser/AOEngine-Manifest.git"
         )
-        self.settings_widgets['index_git_clone_url'].pack(pady=2, padx=10, fill="x")
 
         # Branch
-        self.branch_label = ctk.CTkLabel(index_frame, text=self.translator.get("branch_label"))
-        self.branch_label.pack(pady=2, padx=10, anchor="w")
-        self.settings_widgets['index_git_branch'] = ctk.CTkEntry(
-            index_frame,
-            fg_color=FLY_AGARIC_WHITE,
-            text_color=FLY_AGARIC_BLACK,
+        self.branch_label = self._labeled_entry(
+            index_frame, self.translator.get("branch_label"), 'index_git_branch',
             placeholder_text="main"
         )
-        self.settings_widgets['index_git_branch'].pack(pady=2, padx=10, fill="x")
 
         # Local Folder
-        self.local_folder_label = ctk.CTkLabel(index_frame, text=self.translator.get("local_folder_label"))
-        self.local_folder_label.pack(pady=2, padx=10, anchor="w")
-        self.settings_widgets['index_git_local_folder'] = ctk.CTkEntry(
-            index_frame,
-            fg_color=FLY_AGARIC_WHITE,
-            text_color=FLY_AGARIC_BLACK,
+        self.local_folder_label = self._labeled_entry(
+            index_frame, self.translator.get("local_folder_label"), 'index_git_local_folder',
             placeholder_text="_index_repo_data"
         )
-        self.settings_widgets['index_git_local_folder'].pack(pady=2, padx=10, fill="x")
 
         # Token Settings Section
-        tokens_frame = ctk.CTkFrame(scrollable_frame, fg_color=FLY_AGARIC_BLACK,
-                                   border_color=FLY_AGARIC_RED, border_width=2)
+        tokens_frame = ctk.CTkFrame(scrollable_frame, **SECTION_FRAME)
         tokens_frame.pack(pady=10, padx=10, fill="x")
 
         self.auth_tokens_label = ctk.CTkLabel(tokens_frame, text=self.translator.get("auth_tokens_label"),
-                    font=ctk.CTkFont(size=14, weight="bold"))
+                    font=self._font_header)
         self.auth_tokens_label.pack(pady=5, padx=10, anchor="w")
 
         # Single Token Checkbox and Field
@@ -441,16 +547,12 @@ class App(ctk.CTkToplevel):
         )
         self.use_single_token_checkbox.pack(pady=5, padx=10, anchor="w")
 
-        self.github_token_label = ctk.CTkLabel(tokens_frame, text=self.translator.get("github_token_label"))
-        self.github_token_label.pack(pady=2, padx=10, anchor="w")
-        self.settings_widgets['github_token_single'] = ctk.CTkEntry(
-            tokens_frame,
+        self.github_token_label = self._labeled_entry(
+            tokens_frame, self.translator.get("github_token_label"), 'github_token_single',
             show="*",
-            fg_color=FLY_AGARIC_WHITE,
-            text_color=FLY_AGARIC_BLACK,
             placeholder_text="ghp_YourGitHubToken"
         )
-        self.settings_widgets['github_token_single'].pack(pady=2, padx=10, fill="x")
+        self._tokens_mode = "single" # Which token fields are currently packed
 
         # Index Token (separate field)
         self.index_token_label = ctk.CTkLabel(tokens_frame, text=self.translator.get("index_repo_token_label"))
@@ -473,31 +575,24 @@ class App(ctk.CTkToplevel):
         )
         
         # Provider Settings Section
-        provider_frame = ctk.CTkFrame(scrollable_frame, fg_color=FLY_AGARIC_BLACK,
-                                     border_color=FLY_AGARIC_RED, border_width=2)
+        provider_frame = ctk.CTkFrame(scrollable_frame, **SECTION_FRAME)
         provider_frame.pack(pady=10, padx=10, fill="x")
 
         self.asset_provider_settings_label = ctk.CTkLabel(provider_frame, text=self.translator.get("asset_provider_settings_label"),
-                    font=ctk.CTkFont(size=14, weight="bold"))
+                    font=self._font_header)
         self.asset_provider_settings_label.pack(pady=5, padx=10, anchor="w")
 
-        self.github_assets_repo_label = ctk.CTkLabel(provider_frame, text=self.translator.get("github_assets_repo_label"))
-        self.github_assets_repo_label.pack(pady=2, padx=10, anchor="w")
-        self.settings_widgets['github_asset_repo'] = ctk.CTkEntry(
-            provider_frame,
-            fg_color=FLY_AGARIC_WHITE,
-            text_color=FLY_AGARIC_BLACK,
+        self.github_assets_repo_label = self._labeled_entry(
+            provider_frame, self.translator.get("github_assets_repo_label"), 'github_asset_repo',
             placeholder_text="user/assets-repo"
         )
-        self.settings_widgets['github_asset_repo'].pack(pady=2, padx=10, fill="x")
 
         # Catbox Settings Section
-        catbox_frame = ctk.CTkFrame(scrollable_frame, fg_color=FLY_AGARIC_BLACK,
-                                   border_color=FLY_AGARIC_RED, border_width=2)
+        catbox_frame = ctk.CTkFrame(scrollable_frame, **SECTION_FRAME)
         catbox_frame.pack(pady=10, padx=10, fill="x")
 
         self.catbox_config_label = ctk.CTkLabel(catbox_frame, text=self.translator.get("catbox_config_label"),
-                    font=ctk.CTkFont(size=14, weight="bold"))
+                    font=self._font_header)
         self.catbox_config_label.pack(pady=5, padx=10, anchor="w")
 
         # Anonymous upload checkbox
@@ -512,16 +607,11 @@ class App(ctk.CTkToplevel):
         )
         self.catbox_anonymous_checkbox.pack(pady=5, padx=10, anchor="w")
 
-        self.catbox_hash_label = ctk.CTkLabel(catbox_frame, text=self.translator.get("catbox_user_hash_label"))
-        self.catbox_hash_label.pack(pady=2, padx=10, anchor="w")
-        self.settings_widgets['catbox_user_hash'] = ctk.CTkEntry(
-            catbox_frame,
+        self.catbox_hash_label = self._labeled_entry(
+            catbox_frame, self.translator.get("catbox_user_hash_label"), 'catbox_user_hash',
             show="*",
-            fg_color=FLY_AGARIC_WHITE,
-            text_color=FLY_AGARIC_BLACK,
-            placeholder_text=self.translator.get('catbox_user_hash_placeholder') if hasattr(self, 'translator') else 'Leave empty for anonymous uploads'
+            placeholder_text=self.translator.get('catbox_user_hash_placeholder')
         )
-        self.settings_widgets['catbox_user_hash'].pack(pady=2, padx=10, fill="x")
 
         # --- Language Switcher ---
         language_frame = ctk.CTkFrame(scrollable_frame, fg_color="transparent")
@@ -543,9 +633,7 @@ class App(ctk.CTkToplevel):
             button_frame,
             text=self.translator.get("save_settings_button"),
             command=self._save_settings,
-            fg_color=FLY_AGARIC_RED,
-            hover_color=FLY_AGARIC_WHITE,
-            text_color=FLY_AGARIC_WHITE
+            **PRIMARY_BUTTON
         )
         self.save_settings_button.pack(side="right", padx=5)
 
@@ -553,13 +641,24 @@ class App(ctk.CTkToplevel):
             button_frame,
             text=self.translator.get("reload_settings_button"),
             command=self._load_settings_from_env,
-            fg_color=FLY_AGARIC_BLACK,
-            hover_color=FLY_AGARIC_RED,
-            border_color=FLY_AGARIC_RED,
-            border_width=2
+            **SECONDARY_BUTTON
         )
         self.load_settings_button.pack(side="right", padx=5)
 
+    def _labeled_entry(self, parent, label_text: str, widget_key: str, **entry_kwargs) -> ctk.CTkLabel:
+        """Packs a label with a settings entry below it and registers the entry under widget_key."""
+        label = ctk.CTkLabel(parent, text=label_text)
+        label.pack(pady=2, padx=10, anchor="w")
+        entry = ctk.CTkEntry(
+            parent,
+            fg_color=FLY_AGARIC_WHITE,
+            text_color=FLY_AGARIC_BLACK,
+            **entry_kwargs
+        )
+        entry.pack(pady=2, padx=10, fill="x")
+        self.settings_widgets[widget_key] = entry
+        return label
+
     def _create_info_tab(self):
         """Creates the info tab with application details."""
         info_tab = self.tabview.tab("info")
@@ -568,8 +667,7 @@ class App(ctk.CTkToplevel):
         scrollable_frame = ctk.CTkScrollableFrame(info_tab, fg_color="transparent")
         scrollable_frame.pack(fill="both", expand=True, padx=5, pady=5)
 
-        main_frame = ctk.CTkFrame(scrollable_frame, fg_color=FLY_AGARIC_BLACK,
-                                  border_color=FLY_AGARIC_RED, border_width=2)
+        main_frame = ctk.CTkFrame(scrollable_frame, **SECTION_FRAME)
         main_frame.pack(pady=10, padx=10, fill="x")
         main_frame.grid_columnconfigure(0, weight=1)
 
@@ -598,7 +696,11 @@ class App(ctk.CTkToplevel):
     def _toggle_token_fields(self):
         """Show/hide separate token fields based on checkbox."""
         use_single = self.use_single_token_var.get()
-        
+        mode = "single" if use_single else "separate"
+        if mode == self._tokens_mode:
+            return
+        self._tokens_mode = mode
+
         # Single token field
         single_token_widget = self.settings_widgets['github_token_single']
         
@@ -609,9 +711,8 @@ class App(ctk.CTkToplevel):
         assets_widget = self.settings_widgets['github_token_for_assets']
 
         if use_single:
-            if not single_token_widget.winfo_ismapped():
-                single_token_widget.pack(pady=2, padx=10, fill="x")
-            
+            single_token_widget.pack(pady=2, padx=10, fill="x")
+
             index_label.pack_forget()
             index_widget.pack_forget()
             assets_label.pack_forget()
@@ -619,11 +720,10 @@ class App(ctk.CTkToplevel):
         else:
             single_token_widget.pack_forget()
 
-            if not index_label.winfo_ismapped():
-                index_label.pack(pady=2, padx=10, anchor="w")
-                index_widget.pack(pady=2, padx=10, fill="x")
-                assets_label.pack(pady=2, padx=10, anchor="w")
-                assets_widget.pack(pady=2, padx=10, fill="x")
+            index_label.pack(pady=2, padx=10, anchor="w")
+            index_widget.pack(pady=2, padx=10, fill="x")
+            assets_label.pack(pady=2, padx=10, anchor="w")
+            assets_widget.pack(pady=2, padx=10, fill="x")
 
     def _toggle_catbox_fields(self):
         """Enable/disable catbox hash field based on anonymous checkbox."""
@@ -678,17 +778,42 @@ class App(ctk.CTkToplevel):
                 settings_to_save['catbox_user_hash'] = self.settings_widgets['catbox_user_hash'].get().strip()
             
             settings_to_save['ui_language'] = self.language_option_menu.get()
-    
+        except Exception as e:
+            logging.error(f"Failed to save settings: {e}", exc_info=True)
+            self._log_status(f"ERROR: Failed to save settings: {e}")
+            return
+
+        # Writing the .env file and rebuilding the providers happen off the main thread
+        self.save_settings_button.configure(state="disabled")
+        thread = threading.Thread(target=self._save_settings_bg, args=(settings_to_save,))
+        thread.daemon = True
+        thread.start()
+
+    def _save_settings_bg(self, settings_to_save: Dict):
+        """Persists the collected settings and re-configures the providers."""
+        try:
             settings.save_settings(**settings_to_save)
-            # Re-configure providers with new settings
-            self._configure_providers()
-            self._log_status(self.translator.get("settings_saved_successfully"))
+            saved = True
         except Exception as e:
             logging.error(f"Failed to save settings: {e}", exc_info=True)
             self._log_status(f"ERROR: Failed to save settings: {e}")
+            saved = False
+        else:
+            self._log_status(self.translator.get("settings_saved_successfully"))
+        if not self.is_closing:
+            self.after(0, self._on_save_settings_done, saved)
+
+    def _on_save_settings_done(self, saved: bool):
+        self.save_settings_button.configure(state="normal")
+        if saved:
+            # Re-configure providers with new settings
+            self._configure_providers()
 
     def _load_settings_from_env(self):
         """Load current settings into GUI fields."""
+        if not self._settings_built:
+            return
+
         # --- Index Repo ---
         self._set_entry_text('index_git_clone_url', settings.INDEX_GIT_CLONE_URL)
         self._set_entry_text('index_git_branch', settings.INDEX_GIT_BRANCH)
@@ -736,116 +861,174 @@ class App(ctk.CTkToplevel):
         new_files = filedialog.askopenfilenames()
         if not new_files:
             return
-        
+
+        # Set lookups keep this O(selection), so it stays on the main thread
+        self._apply_new_files(new_files)
+
+    def _apply_new_files(self, new_files):
+        """Adds the paths that are not selected yet and refreshes the list."""
+        added = []
         for f in new_files:
-            if f not in self.file_paths:
+            if f not in self._file_paths_set:
+                self._file_paths_set.add(f)
                 self.file_paths.append(f)
-        self._update_file_list_display()
+                added.append(f)
+        self._append_to_file_list_display(added)
         self._validate_inputs()
 
     def _clear_files(self):
         """Clears the list of selected files."""
         self.file_paths.clear()
-        self._update_file_list_display()
+        self._file_paths_set.clear()
+        self._rebuild_file_list_display()
         self._validate_inputs()
 
     def _on_drop_files(self, event):
         """Handles files dropped onto the textbox."""
         # event.data contains dropped files, one per line or space-separated
         dropped_files = self._parse_drop_data(event.data)
-        for f in dropped_files:
-            f = f.strip('{}')  # Remove braces if any
-            if f and os.path.isfile(f) and f not in self.file_paths:
-                self.file_paths.append(f)
-        self._update_file_list_display()
-        self._validate_inputs()
+        # Already selected paths need no filesystem check
+        candidates = [f for f in dropped_files if f not in self._file_paths_set]
+        if not candidates:
+            return
+
+        self._executor.submit(self._filter_dropped_files_bg, candidates)
+
+    def _filter_dropped_files_bg(self, candidates: List[str]):
+        """Keeps only the dropped paths that are files, stat-ing them off the main thread."""
+        accepted = [f for f in candidates if os.path.isfile(f)]
+        # Schedule the list update on the main thread, unless the window is gone
+        if not self.is_closing:
+            self.after(0, self._apply_new_files, accepted)
 
     def _parse_drop_data(self, data: str) -> List[str]:
         """Parses the drop data into list of file paths."""
-        import os
-        # Split by space or newline, handle quoted paths
-        paths = []
-        current = ""
-        in_quotes = False
-        for char in data:
-            if char == '"' and (not current or current[-1] != '\\'):
-                in_quotes = not in_quotes
-            elif char in [' ', '\n', '\r'] and not in_quotes:
-                if current:
-                    paths.append(current)
-                    current = ""
-            else:
-                current += char
-        if current:
-            paths.append(current)
-        return [p.strip('"') for p in paths if p.strip()]
+        # Fast path: without braces or quotes, plain whitespace splitting is enough
+        if '{' not in data and '"' not in data:
+            return data.split()
+
+        # tkdnd delivers a Tcl list, so let Tcl unwrap braced and quoted paths
+        return [p for p in self.tk.splitlist(data) if p]
+
+    def _rebuild_file_list_display(self):
+        """Clears the file list box and renders all selected paths, or the placeholder."""
+        # Abort any render still in progress for a previous list
+        if self._render_after_id is not None:
+            self.after_cancel(self._render_after_id)
+            self._render_after_id = None
 
-    def _update_file_list_display(self):
-        """Updates the text in the file list box."""
         self.file_list_textbox.configure(state="normal")
         self.file_list_textbox.delete("1.0", "end")
         if not self.file_paths:
             self.file_list_textbox.insert("1.0", self.translator.get("file_list_placeholder"))
-        else:
-            self.file_list_textbox.insert("1.0", "\n".join(self.file_paths))
+            self.file_list_textbox.configure(state="disabled")
+            return
         self.file_list_textbox.configure(state="disabled")
 
+        self._pending_render_idx = 0
+        self._render_next_chunk()
+
+    def _append_to_file_list_display(self, new_paths: List[str]):
+        """Renders only the newly added paths instead of rewriting the whole list."""
+        if not new_paths:
+            return
+        if self._render_after_id is not None:
+            # A chunked render is in progress and will pick up the new tail
+            return
+        if len(new_paths) == len(self.file_paths):
+            # The list was empty, so the placeholder has to be replaced
+            self._rebuild_file_list_display()
+            return
+
+        self._pending_render_idx = len(self.file_paths) - len(new_paths)
+        self._render_next_chunk()
+
+    def _render_next_chunk(self):
+        """Inserts the next chunk of paths, rescheduling itself so Tk stays responsive."""
+        self._render_after_id = None
+        start = self._pending_render_idx
+        chunk = self.file_paths[start:start + FILE_LIST_RENDER_CHUNK]
+
+        self.file_list_textbox.configure(state="normal")
+        self.file_list_textbox.insert("end", ("\n" if start else "") + "\n".join(chunk))
+        self.file_list_textbox.configure(state="disabled")
+
+        self._pending_render_idx = start + len(chunk)
+        if self._pending_render_idx < len(self.file_paths):
+            self._render_after_id = self.after(1, self._render_next_chunk)
+
+    def _on_provider_toggle(self, cb: ctk.CTkCheckBox):
+        """Updates the cached provider selection when a checkbox is toggled."""
+        if cb.get():
+            self._selected_providers_set.add(cb)
+        else:
+            self._selected_providers_set.discard(cb)
+        self._any_provider_checked = bool(self._selected_providers_set)
+        self._validate_inputs()
+
+    def _schedule_validation(self, event=None):
+        """Debounces validation while typing, so a burst of keystrokes validates once."""
+        if self._validate_after_id is not None:
+            self.after_cancel(self._validate_after_id)
+        self._validate_after_id = self.after(100, self._validate_inputs)
+
     def _validate_inputs(self, event=None):
         """Enable the release button only if all inputs are valid."""
-        version_ok = bool(self.version_entry.get().strip())
-        files_ok = bool(self.file_paths)
-        provider_ok = any(cb.get() for cb in self.provider_checkboxes)
+        # A direct call supersedes any pending debounced run
+        if self._validate_after_id is not None:
+            self.after_cancel(self._validate_after_id)
+            self._validate_after_id = None
+        if not self._ui_enabled:
+            return
+        # Cheapest checks first; the entry read is a Tcl round-trip
+        all_ok = (
+            self._any_provider_checked
+            and bool(self.file_paths)
+            and bool(self.version_entry.get().strip())
+        )
+        new_state = "normal" if all_ok else "disabled"
 
-        if version_ok and files_ok and provider_ok:
-            self.create_release_button.configure(state="normal")
-        else:
-            self.create_release_button.configure(state="disabled")
+        if new_state != self._last_valid_state:
+            self.create_release_button.configure(state=new_state)
+            self._last_valid_state = new_state
 
     def _on_notes_focus_in(self, event=None):
         """Removes placeholder text on focus."""
-        if self.notes_textbox.get("1.0", "end-1c").strip() == self.NOTES_PLACEHOLDER:
+        if self._notes_is_placeholder:
             self.notes_textbox.delete("1.0", "end")
             self.notes_textbox.configure(text_color=FLY_AGARIC_BLACK)
+            self._notes_is_placeholder = False
 
     def _on_notes_focus_out(self, event=None):
         """Adds placeholder text if entry is empty."""
-        if not self.notes_textbox.get("1.0", "end-1c").strip():
+        if not self._notes_is_placeholder and not self.notes_textbox.get("1.0", "end-1c").strip():
+            self.notes_textbox.delete("1.0", "end")
             self.notes_textbox.insert("1.0", self.NOTES_PLACEHOLDER)
             self.notes_textbox.configure(text_color="grey")
+            self._notes_is_placeholder = True
     
     def _toggle_ui_elements(self, enabled: bool):
         """Enable or disable all interactive UI elements."""
+        if enabled == self._ui_enabled:
+            return
+        self._ui_enabled = enabled
         state = "normal" if enabled else "disabled"
 
         # Main interaction elements
-        self.create_release_button.configure(state=state)
-        self.version_entry.configure(state=state)
-        self.notes_textbox.configure(state=state)
+        for widget in self._toggleable_widgets:
+            widget.configure(state=state)
 
         # Provider checkboxes
         for cb in self.provider_checkboxes:
             cb.configure(state=state)
 
-        # File manipulation buttons
-        try:
-            # These buttons are embedded in the tab structure, so we need to find them
-            self._find_and_toggle_file_buttons(state)
-        except Exception as e:
-            logging.warning(f"Could not toggle file buttons: {e}")
-
-    def _find_and_toggle_file_buttons(self, state):
-        """Helper method to find and toggle file action buttons."""
-        upload_tab = self.tabview.tab("upload")
-
-        # Recursively search for buttons in the upload tab
-        def toggle_buttons_in_frame(frame, new_state):
-            for child in frame.winfo_children():
-                if isinstance(child, ctk.CTkButton) and ("Browse" in child.cget("text") or "Clear" in child.cget("text")):
-                    child.configure(state=new_state)
-                elif isinstance(child, ctk.CTkFrame):
-                    toggle_buttons_in_frame(child, new_state)
-
-        toggle_buttons_in_frame(upload_tab, state)
+        if enabled:
+            # The release button follows the inputs, not the toggle
+            self._last_valid_state = None
+            self._validate_inputs()
+        else:
+            self.create_release_button.configure(state=state)
+            self._last_valid_state = state
 
     def _open_console_window(self):
         if self.console_window is None or not self.console_window.winfo_exists():
@@ -855,13 +1038,12 @@ class App(ctk.CTkToplevel):
     
     def _open_upload_notes_popup(self):
         """Opens a popup to edit the release notes."""
-        current_notes = self.notes_textbox.get("1.0", "end-1c")
-        if current_notes.strip() == self.NOTES_PLACEHOLDER:
-            current_notes = ""
+        current_notes = "" if self._notes_is_placeholder else self.notes_textbox.get("1.0", "end-1c")
 
         def save_callback(new_notes):
             self.notes_textbox.delete("1.0", "end")
             self.notes_textbox.insert("1.0", new_notes)
+            self._notes_is_placeholder = False
             if not new_notes.strip():
                 self._on_notes_focus_out() # Restore placeholder if empty
             else:
@@ -870,45 +1052,78 @@ class App(ctk.CTkToplevel):
         NotesEditPopup(self, current_notes, save_callback)
 
     def _log_status(self, message: str):
-        """Thread-safe method to log a message to the feedback queue."""
-        logging.info(message)
-        self.feedback_queue.put(message)
+        """Thread-safe method to log a message to the feedback queue.
 
-    def _process_feedback_queue(self):
+        This is the only way worker threads report to the window; widgets are updated in _drain_feedback_queue.
+        """
+        logging.info(message)
+        # Terminate the line here so the GUI thread can insert it as-is
+        self.feedback_queue.put(message + "\n")
+        # Wake the GUI only when there is something to show, once per burst
+        if not self._flush_pending and not self.is_closing:
+            self._flush_pending = True
+            self.after_idle(self._drain_feedback_queue)
+
+    def _drain_feedback_queue(self):
         """Processes messages from the feedback queue and updates the GUI."""
+        self._flush_pending = False
         if self.is_closing:
             return
 
-        try:
-            while True:
-                message = self.feedback_queue.get_nowait()
-                # Check if widgets still exist before updating
-                if self.feedback_textbox.winfo_exists():
-                    self.feedback_textbox.configure(state="normal")
-                    self.feedback_textbox.insert("end", f"{message}\n")
-                    self.feedback_textbox.see("end")  # Scroll to the end
-                    self.feedback_textbox.configure(state="disabled")
-
-        except queue.Empty:
-            pass
-        finally:
-            self.after(100, self._process_feedback_queue)
+        # Collect what is queued so far and apply it in a single widget update
+        # This is the only consumer, so a non-empty queue cannot run dry before get_nowait
+        batch = []
+        while len(batch) < FEEDBACK_DRAIN_LIMIT and not self.feedback_queue.empty():
+            batch.append(self.feedback_queue.get_nowait())
+
+        if not batch:
+            return
+
+        # Hitting the cap means more is waiting; catch up without starving other events
+        if len(batch) == FEEDBACK_DRAIN_LIMIT and not self._flush_pending:
+            self._flush_pending = True
+            self.after(10, self._drain_feedback_queue)
+
+        # Check if widgets still exist before updating
+        if self.feedback_textbox.winfo_exists():
+            self.feedback_textbox.configure(state="normal")
+            self.feedback_textbox.insert("end", "".join(batch))
+            line_count = int(self.feedback_textbox.index("end-1c").split(".")[0])
+            if line_count > FEEDBACK_MAX_LINES:
+                self.feedback_textbox.delete("1.0", f"{line_count - FEEDBACK_MAX_LINES}.0")
+            self.feedback_textbox.see("end")  # Scroll to the end
+            self.feedback_textbox.configure(state="disabled")
+
+    def _on_log_record(self):
+        """Thread-safe wakeup from the logging handler; schedules one console update per burst."""
+        if not self._log_drain_pending and not self.is_closing:
+            self._log_drain_pending = True
+            self.after_idle(self._process_log_queue)
 
     def _process_log_queue(self):
         """Processes messages from the logging queue to update the console."""
-        try:
-            while not log_queue.empty():
-                message = log_queue.get_nowait()
-                if self.console_window and self.console_window.winfo_exists():
-                    self.console_window.log(message)
-        except queue.Empty:
-            pass
-        finally:
-            self.after(100, self._process_log_queue)
+        self._log_drain_pending = False
+        if self.is_closing:
+            return
+
+        # This is the only consumer, so a non-empty queue cannot run dry before get_nowait
+        messages = []
+        while not log_queue.empty():
+            messages.append(log_queue.get_nowait())
+        if messages and self.console_window and self.console_window.winfo_exists():
+            self.console_window.log("\n".join(messages))
 
     def _on_closing(self):
         """Handle the window closing event."""
         self.is_closing = True
+        set_log_listener(None)
+        # Stop pending timers so nothing fires while Tk is torn down
+        for after_id in (self._render_after_id, self._validate_after_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._executor.shutdown(cancel_futures=True)
+        self._manifest_pool.shutdown(cancel_futures=True)
+        self._http_session.close()
         self.master.destroy()  # Destroy the root window to ensure the app exits
 
     def start_release_process(self):
@@ -923,12 +1138,10 @@ class App(ctk.CTkToplevel):
         selected_providers = [
             provider
             for cb, provider in self.provider_checkboxes.items()
-            if cb.get()
+            if cb in self._selected_providers_set
         ]
 
-        notes_text = self.notes_textbox.get("1.0", "end-1c")
-        if notes_text.strip() == self.NOTES_PLACEHOLDER:
-            notes_text = ""
+        notes_text = "" if self._notes_is_placeholder else self.notes_textbox.get("1.0", "end-1c")
 
         workflow = ReleaseWorkflow(
             version=self.version_entry.get().strip(),
@@ -940,9 +1153,7 @@ class App(ctk.CTkToplevel):
             profiler=self.profiler_checkbox.get(),
         )
 
-        thread = threading.Thread(target=self._run_workflow_in_thread, args=(workflow,))
-        thread.daemon = True  # Ensure thread doesn't block app exit
-        thread.start()
+        self._executor.submit(self._run_workflow_in_thread, workflow)
 
     def _run_workflow_in_thread(self, workflow: ReleaseWorkflow):
         """Wrapper to run the workflow and re-enable UI on completion."""
@@ -952,11 +1163,16 @@ class App(ctk.CTkToplevel):
             logging.error(f"Release workflow failed: {e}", exc_info=True)
             self._log_status(self.translator.get("error_unexpected", error=str(e)))
         finally:
-            # Schedule the UI update to run in the main thread
-            self.after(0, self._toggle_ui_elements, True)
+            # Schedule the UI update to run in the main thread, unless the window is gone
+            if not self.is_closing:
+                self.after(0, self._toggle_ui_elements, True)
 
     def _start_fetch_releases(self):
         """Fetches release data in a background thread."""
+        if self.index_provider is None:
+            self._log_status(self._providers_status_text())
+            return
+
         if self.is_fetching_releases:
             self._log_status(self.translator.get("status_refresh_in_progress"))
             return
@@ -965,176 +1181,207 @@ class App(ctk.CTkToplevel):
         self.is_fetching_releases = True
         self.refresh_releases_button.configure(state="disabled")
 
-        thread = threading.Thread(target=self._fetch_releases_thread)
-        thread.daemon = True
-        thread.start()
+        self._executor.submit(self._fetch_releases_thread)
 
     def _fetch_releases_thread(self):
         """The actual fetching and processing of release data."""
         try:
             versions_data = self.index_provider.get_index_content()
             
-            # Use a thread pool to fetch manifest files in parallel
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                # Create a future for each manifest URL
-                future_to_version = {
-                    executor.submit(self._fetch_manifest, url): version
-                    for version in versions_data
-                    for url in version.get("manifest_urls", {}).values()
-                }
-
-                full_release_data = []
-                for future in future_to_version:
-                    version_info = future_to_version[future]
-                    try:
-                        manifest_data = future.result()
-                        # Keep data sources separate to avoid contamination
-                        full_release_data.append({
-                            "version_data": version_info,
-                            "manifest_data": manifest_data
-                        })
-                    except Exception as e:
-                        logging.error(f"Failed to fetch manifest for {version_info.get('version')}: {e}")
-
-            # Schedule the UI update on the main thread
-            self.after(0, self._update_releases_ui, full_release_data)
+            # Every (version, url) pair becomes a row, but each URL is fetched only once
+            tasks = [
+                (version, url)
+                for version in versions_data
+                for url in version.get("manifest_urls", {}).values()
+            ]
+            unique_urls = list(dict.fromkeys(url for _, url in tasks))
+
+            # Use the manifest pool to fetch manifest files in parallel
+            future_to_url = {
+                self._manifest_pool.submit(self._fetch_manifest, url): url
+                for url in unique_urls
+            }
+            results_by_url = {}
+            for future in as_completed(future_to_url):
+                url = future_to_url[future]
+                try:
+                    results_by_url[url] = future.result()
+                except Exception as e:
+                    logging.error(f"Failed to fetch manifest {url}: {e}")
+
+            # Keep data sources separate to avoid contamination
+            full_release_data = [
+                {"version_data": version_info, "manifest_data": results_by_url[url]}
+                for version_info, url in tasks
+                if url in results_by_url
+            ]
+
+            # Schedule the UI update on the main thread, unless the window is gone
+            if not self.is_closing:
+                self.after(0, self._update_releases_ui, full_release_data)
 
         except Exception as e:
             logging.error(f"Failed to fetch versions.json: {e}", exc_info=True)
             self._log_status(self.translator.get("error_failed_to_fetch", error=str(e)))
         finally:
-            # Re-enable the refresh button and reset the flag
-            self.after(0, lambda: self.refresh_releases_button.configure(state="normal"))
-            self.is_fetching_releases = False
+            # Schedule the button and flag reset on the main thread
+            if not self.is_closing:
+                self.after(0, self._on_fetch_releases_done)
+
+    def _on_fetch_releases_done(self):
+        """Re-enables the refresh button and allows the next fetch."""
+        self.refresh_releases_button.configure(state="normal")
+        self.is_fetching_releases = False
 
     def _fetch_manifest(self, url: str) -> dict:
-        """Fetches and parses a single manifest file from a URL."""
-        response = requests.get(url, timeout=10)
+        """Fetches and parses a single manifest file from a URL, reusing the cached copy if it is unchanged."""
+        cached = self._manifest_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._http_session.get(url, headers=headers, timeout=(3, 7))  # (connect, read): fail fast on unreachable hosts
+        if cached and response.status_code == 304:
+            return cached[1]
         response.raise_for_status()
-        return response.json()
+        manifest = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            self._manifest_cache[url] = (etag, manifest)
+        return manifest
 
     def _update_releases_ui(self, release_data: List[dict]):
-        """Clears and rebuilds the releases UI from fetched data into a table format."""
-        # Clear existing widgets
-        for widget_info in self.release_widgets:
-            # Unpack all widgets in the row and destroy them
+        """Updates the releases table in place, hiding or adding rows for the size difference."""
+        self._releases_generation += 1  # Invalidates saves started against the previous contents
+        # Hide the rows that are no longer needed and keep them for a later refresh
+        while len(self.release_widgets) > len(release_data):
+            widget_info = self.release_widgets.pop()
             for widget in widget_info.values():
                 if isinstance(widget, ctk.CTkBaseClass):
-                    widget.destroy()
-        self.release_widgets.clear()
+                    widget.grid_remove()
+            self._spare_release_rows.append(widget_info)
 
         if not release_data:
-            # Check if a 'no releases' label already exists
-            if not hasattr(self, '_no_releases_label') or not self._no_releases_label.winfo_exists():
-                self._no_releases_label = ctk.CTkLabel(self.releases_scroll_frame, text=self.translator.get("no_releases_found"))
-                self._no_releases_label.pack(pady=10)
+            for header in self.header_labels:
+                header.grid_remove()
+            if self._no_releases_label is None:
+                self._no_releases_label = ctk.CTkLabel(self.releases_scroll_frame)
+            self._no_releases_label.configure(text=self.translator.get("no_releases_found"))
+            self._no_releases_label.grid(row=0, column=0, columnspan=6, pady=10)
             return
-        elif hasattr(self, '_no_releases_label') and self._no_releases_label.winfo_exists():
-            self._no_releases_label.destroy()
-
-        # Configure grid columns for the table
-        self.releases_scroll_frame.grid_columnconfigure(0, weight=0, minsize=50)   # Checkbox
-        self.releases_scroll_frame.grid_columnconfigure(1, weight=0, minsize=50)   # Profiler
-        self.releases_scroll_frame.grid_columnconfigure(2, weight=1, minsize=100)  # Version
-        self.releases_scroll_frame.grid_columnconfigure(3, weight=2, minsize=150)  # Upload Date
-        self.releases_scroll_frame.grid_columnconfigure(4, weight=1, minsize=150)  # SHA
-        self.releases_scroll_frame.grid_columnconfigure(5, weight=3, minsize=200)  # Release Notes
-
-
-        # Create Header
-        self.header_labels = []
-        header_font = ctk.CTkFont(weight="bold")
-        headers = [
-            self.translator.get("header_latest"),
-            self.translator.get("header_profiler"),
-            self.translator.get("header_version"),
-            self.translator.get("header_upload_date"),
-            self.translator.get("header_sha256"),
-            self.translator.get("header_release_notes")
-        ]
-        for col, header_text in enumerate(headers):
-            header = ctk.CTkLabel(self.releases_scroll_frame, text=header_text, font=header_font)
-            header.grid(row=0, column=col, padx=10, pady=5, sticky="w")
-            self.header_labels.append(header)
+        elif self._no_releases_label is not None:
+            self._no_releases_label.grid_remove()
+
+        # Create Header once; later refreshes only show it again
+        if not self.header_labels:
+            headers = [
+                self.translator.get("header_latest"),
+                self.translator.get("header_profiler"),
+                self.translator.get("header_version"),
+                self.translator.get("header_upload_date"),
+                self.translator.get("header_sha256"),
+                self.translator.get("header_release_notes")
+            ]
+            for col, header_text in enumerate(headers):
+                header = ctk.CTkLabel(self.releases_scroll_frame, text=header_text, font=self._font_table_header)
+                header.grid(row=0, column=col, padx=10, pady=5, sticky="w")
+                self.header_labels.append(header)
+        else:
+            for header in self.header_labels:
+                header.grid()
 
-        # Create Table Rows
+        # Reuse the existing rows, then the hidden ones, and only create what is still missing.
+        # Spare rows are popped in the order they were hidden, so each returns to its own row index.
         for i, release_entry in enumerate(release_data):
-            row_index = i + 1  # Start after header row
-            
-            version_data = release_entry.get("version_data", {})
-            manifest_data = release_entry.get("manifest_data", {})
-
-            version = version_data.get("version", "N/A")
-            upload_date = manifest_data.get("upload_date", "N/A")
-            sha = manifest_data.get("archive_sha256", "N/A")
-            is_latest = version_data.get("latest", False)
-            is_profiler = manifest_data.get("profiler", False)
-            release_notes = manifest_data.get("release_notes", "")
-
-
-            # Latest Checkbox
-            latest_var = ctk.BooleanVar(value=is_latest)
-            latest_checkbox = ctk.CTkCheckBox(
-                self.releases_scroll_frame,
-                text="",
-                variable=latest_var,
-                command=lambda var=latest_var: self._on_latest_checkbox_change(var),
-                fg_color=FLY_AGARIC_RED
-            )
-            latest_checkbox.grid(row=row_index, column=0, padx=10, pady=5)
-            
-            # Profiler Checkbox
-            profiler_var = ctk.BooleanVar(value=is_profiler)
-            profiler_checkbox = ctk.CTkCheckBox(
-                self.releases_scroll_frame,
-                text="",
-                variable=profiler_var,
-                command=self._on_widget_change,
-                fg_color=FLY_AGARIC_RED
-            )
-            profiler_checkbox.grid(row=row_index, column=1, padx=10, pady=5)
+            if i == len(self.release_widgets):
+                if self._spare_release_rows:
+                    widget_info = self._spare_release_rows.pop()
+                    for widget in widget_info.values():
+                        if isinstance(widget, ctk.CTkBaseClass):
+                            widget.grid()
+                else:
+                    widget_info = self._create_release_row(i)
+                self.release_widgets.append(widget_info)
+            self._fill_release_row(self.release_widgets[i], release_entry)
+        self._log_status(self.translator.get("status_release_info_updated"))
 
-            # Version Label (not editable)
-            version_label = ctk.CTkLabel(self.releases_scroll_frame, text=version)
-            version_label.grid(row=row_index, column=2, padx=10, pady=5, sticky="ew")
+    def _create_release_row(self, i: int) -> dict:
+        """Creates and grids the widgets of an empty table row."""
+        row_index = i + 1  # Start after header row
+
+        # Latest Checkbox
+        latest_var = ctk.BooleanVar(value=False)
+        latest_checkbox = ctk.CTkCheckBox(
+            self.releases_scroll_frame,
+            text="",
+            variable=latest_var,
+            command=lambda var=latest_var: self._on_latest_checkbox_change(var),
+            fg_color=FLY_AGARIC_RED
+        )
+        latest_checkbox.grid(row=row_index, column=0, padx=10, pady=5)
+
+        # Profiler Checkbox
+        profiler_var = ctk.BooleanVar(value=False)
+        profiler_checkbox = ctk.CTkCheckBox(
+            self.releases_scroll_frame,
+            text="",
+            variable=profiler_var,
+            command=self._on_widget_change,
+            fg_color=FLY_AGARIC_RED
+        )
+        profiler_checkbox.grid(row=row_index, column=1, padx=10, pady=5)
+
+        # Version Label (not editable)
+        version_label = ctk.CTkLabel(self.releases_scroll_frame, text="")
+        version_label.grid(row=row_index, column=2, padx=10, pady=5, sticky="ew")
+
+        # Upload Date Entry
+        date_entry = ctk.CTkEntry(self.releases_scroll_frame)
+        date_entry.grid(row=row_index, column=3, padx=10, pady=5, sticky="ew")
+        date_entry.bind("<KeyRelease>", self._on_widget_change)
+
+        # SHA Label (not editable)
+        sha_label = ctk.CTkLabel(self.releases_scroll_frame, text="")
+        sha_label.grid(row=row_index, column=4, padx=10, pady=5, sticky="ew")
+
+        # Release Notes Button
+        notes_button = ctk.CTkButton(
+            self.releases_scroll_frame,
+            text=self.translator.get("edit_notes_button"),
+            command=lambda i=i: self._open_notes_popup(i)
+        )
+        notes_button.grid(row=row_index, column=5, padx=10, pady=5, sticky="ew")
+
+        # Hidden notes entry to store the value
+        notes_var = ctk.StringVar(value="")
+
+        return {
+            "latest_checkbox": latest_checkbox,
+            "profiler_checkbox": profiler_checkbox,
+            "version_label": version_label,
+            "date_entry": date_entry,
+            "sha_label": sha_label,
+            "notes_button": notes_button,
+            "notes_var": notes_var,
+            "version_data": {},
+            "manifest_data": {},
+            "latest_var": latest_var,
+            "profiler_var": profiler_var,
+        }
+
+    def _fill_release_row(self, widget_info: dict, release_entry: dict):
+        """Shows a fetched release in an existing table row."""
+        version_data = release_entry.get("version_data", {})
+        manifest_data = release_entry.get("manifest_data", {})
+
+        sha = manifest_data.get("archive_sha256", "N/A")
+        widget_info["latest_var"].set(version_data.get("latest", False))
+        widget_info["profiler_var"].set(manifest_data.get("profiler", False))
+        widget_info["version_label"].configure(text=version_data.get("version", "N/A"))
+        widget_info["date_entry"].delete(0, "end")
+        widget_info["date_entry"].insert(0, manifest_data.get("upload_date", "N/A"))
+        widget_info["sha_label"].configure(text=sha[:12] + "...")
+        widget_info["notes_var"].set(manifest_data.get("release_notes", ""))
+        widget_info["version_data"] = version_data
+        widget_info["manifest_data"] = manifest_data
 
-            # Upload Date Entry
-            date_entry = ctk.CTkEntry(self.releases_scroll_frame)
-            date_entry.insert(0, upload_date)
-            date_entry.grid(row=row_index, column=3, padx=10, pady=5, sticky="ew")
-            date_entry.bind("<KeyRelease>", self._on_widget_change)
-            
-            # SHA Label (not editable)
-            sha_label = ctk.CTkLabel(self.releases_scroll_frame, text=sha[:12] + "...")
-            sha_label.grid(row=row_index, column=4, padx=10, pady=5, sticky="ew")
-
-            # Release Notes Button
-            notes_button = ctk.CTkButton(
-                self.releases_scroll_frame,
-                text=self.translator.get("edit_notes_button"),
-                command=lambda i=i: self._open_notes_popup(i)
-            )
-            notes_button.grid(row=row_index, column=5, padx=10, pady=5, sticky="ew")
-
-            # Hidden notes entry to store the value
-            notes_var = ctk.StringVar(value=release_notes)
-
-
-            self.release_widgets.append({
-                "latest_checkbox": latest_checkbox,
-                "profiler_checkbox": profiler_checkbox,
-                "version_label": version_label,
-                "date_entry": date_entry,
-                "sha_label": sha_label,
-                "notes_button": notes_button,
-                "notes_var": notes_var,
-                "version_data": version_data,
-                "manifest_data": manifest_data,
-                "latest_var": latest_var,
-                "profiler_var": profiler_var,
-            })
-        self._log_status(self.translator.get("status_release_info_updated"))
-    
     def _open_notes_popup(self, index: int):
         """Opens a popup to edit the release notes for a specific release."""
         widget_info = self.release_widgets[index]
@@ -1161,10 +1408,15 @@ class App(ctk.CTkToplevel):
     
     def _save_release_changes(self):
         """Saves all changes from the 'Manage Releases' tab to versions.json and manifest files."""
+        # A refresh and a save both pull the same index clone, so they never overlap
+        if self.is_fetching_releases:
+            self._log_status(self.translator.get("status_refresh_in_progress"))
+            return
         self._log_status("Saving release changes...")
         
         updated_versions_content = []
         manifests_to_update = {}
+        saved_rows = []
 
         for widget_info in self.release_widgets:
             original_version_data = widget_info['version_data']
@@ -1200,17 +1452,46 @@ class App(ctk.CTkToplevel):
             version_entry["profiler"] = is_profiler
 
             updated_versions_content.append(version_entry)
+            saved_rows.append((widget_info, version_entry, new_manifest_data))
 
+        # Pulling, committing and pushing the index repo happens off the main thread;
+        # refreshing is blocked until the save is done
+        self.is_fetching_releases = True
+        self.refresh_releases_button.configure(state="disabled")
+        self.save_changes_button.configure(state="disabled")
+        self._executor.submit(
+            self._save_release_changes_bg,
+            updated_versions_content, manifests_to_update, saved_rows, self._releases_generation,
+        )
+
+    def _save_release_changes_bg(self, versions_content: list, manifests_to_update: dict,
+                                 saved_rows: List[tuple], generation: int):
+        """Commits the release changes to the index repo."""
         try:
-            self.index_provider.save_all_changes(updated_versions_content, manifests_to_update)
-            self._log_status("Successfully saved all changes!")
-            self.save_changes_button.configure(state="disabled")
-            # Refresh the data to show the latest state
-            self._start_fetch_releases()
+            self.index_provider.save_all_changes(versions_content, manifests_to_update)
+            succeeded = True
         except Exception as e:
             logging.error(f"Failed to save changes: {e}", exc_info=True)
             self._log_status(self.translator.get("error_failed_to_save", error=str(e)))
+            succeeded = False
+        if not self.is_closing:
+            self.after(0, self._on_release_changes_saved, saved_rows, generation, succeeded)
+
+    def _on_release_changes_saved(self, saved_rows: List[tuple], generation: int, succeeded: bool):
+        """Unblocks refreshing and, on success, keeps the saved data on the rows."""
+        self._on_fetch_releases_done()
+        if not succeeded:
+            self.save_changes_button.configure(state="normal")
+            return
 
+        self._log_status("Successfully saved all changes!")
+        # Rows refilled by a newer refresh hold other releases now, so leave them alone
+        if generation != self._releases_generation:
+            return
+        # What was just written is the latest state, so keep it instead of re-fetching every manifest
+        for widget_info, version_entry, new_manifest_data in saved_rows:
+            widget_info['version_data'] = version_entry
+            widget_info['manifest_data'] = new_manifest_data
 
     def _on_language_select(self, language: str):
         """Sets the language and updates the UI."""
@@ -1221,6 +1502,14 @@ class App(ctk.CTkToplevel):
 
     def _update_ui_text(self):
         """Updates all text in the UI to the current language."""
+        self._update_window_text()
+        self._update_upload_tab_text()
+        self._update_manage_releases_tab_text()
+        self._update_settings_tab_text()
+        self._update_info_tab_text()
+
+    def _update_window_text(self):
+        """Updates the window title and the tab names."""
         self.title(self.translator.get("app_title"))
 
         # Update tab names by accessing the internal segmented button
@@ -1238,11 +1527,6 @@ class App(ctk.CTkToplevel):
         except (AttributeError, KeyError) as e:
             logging.warning(f"Could not update tab names: {e}")
 
-        self._update_upload_tab_text()
-        self._update_manage_releases_tab_text()
-        self._update_settings_tab_text()
-        self._update_info_tab_text()
-
     def _update_upload_tab_text(self):
         self.provider_frame_label.configure(text=self.translator.get("asset_providers_label"))
         self.files_to_upload_label.configure(text=self.translator.get("files_to_upload_label"))
@@ -1256,16 +1540,16 @@ class App(ctk.CTkToplevel):
         self.create_release_button.configure(text=self.translator.get("create_release_button"))
         self.log_label.configure(text=self.translator.get("log_label"))
         self.open_in_new_window_button.configure(text=self.translator.get("open_in_new_window_button"))
+        self.providers_loading_label.configure(text=self._providers_status_text())
 
-        self.file_list_textbox.configure(state="normal")
-        self.file_list_textbox.delete("1.0", "end")
+        # Only the placeholder is translated; a populated list stays as it is
         if not self.file_paths:
-            self.file_list_textbox.insert("1.0", self.translator.get("file_list_placeholder"))
-        self.file_list_textbox.configure(state="disabled")
-        
-        if self.notes_textbox.get("1.0", "end-1c").strip() == self.NOTES_PLACEHOLDER:
+            self._rebuild_file_list_display()
+
+        self.NOTES_PLACEHOLDER = self.translator.get("notes_placeholder")
+        if self._notes_is_placeholder:
             self.notes_textbox.delete("1.0", "end")
-            self.notes_textbox.insert("1.0", self.translator.get("notes_placeholder"))
+            self.notes_textbox.insert("1.0", self.NOTES_PLACEHOLDER)
 
     def _update_manage_releases_tab_text(self):
         if hasattr(self, 'refresh_releases_button'):
@@ -1287,7 +1571,7 @@ class App(ctk.CTkToplevel):
             if col < len(self.header_labels):
                 self.header_labels[col].configure(text=header_text)
             
-        for widget_info in self.release_widgets:
+        for widget_info in self.release_widgets + self._spare_release_rows:
             widget_info['notes_button'].configure(text=self.translator.get("edit_notes_button"))
 
     def _update_settings_tab_text(self):
@@ -1362,13 +1646,13 @@ class ConsoleWindow(ctk.CTkToplevel):
     def _load_history(self):
         """Loads the existing log history into the textbox."""
         self.log_textbox.configure(state="normal")
-        for message in log_history:
-            self.log_textbox.insert("end", message + "\n")
+        if log_history:
+            self.log_textbox.insert("end", "\n".join(log_history) + "\n")
         self.log_textbox.see("end")
         self.log_textbox.configure(state="disabled")
 
     def log(self, message: str):
-        """Appends a message to the log display."""
+        """Appends a message, or several newline-joined ones, to the log display."""
         self.log_textbox.configure(state="normal")
         self.log_textbox.insert("end", message + "\n")
         self.log_textbox.see("end") # Scroll to the end
@@ -4,9 +4,11 @@ from .base import AssetProvider
 
 
 class CatboxProvider(AssetProvider):
-    def __init__(self, user_hash: str = None):
+    def __init__(self, user_hash: str = None, session: requests.Session = None):
         self._user_hash = user_hash  # Can be None for anonymous uploads
         self._api_url = "https://catbox.moe/user/api.php"
+        # Reusing a session keeps the connection to Catbox alive between uploads
+        self._session = session or requests.Session()
 
     def upload_asset(self, file_path: str, release_version: str) -> str:
         try:
@@ -19,7 +21,7 @@ class CatboxProvider(AssetProvider):
                 if self._user_hash:
                     data["userhash"] = self._user_hash
 
-                response = requests.post(self._api_url, files=files, data=data)
+                response = self._session.post(self._api_url, files=files, data=data)
                 response.raise_for_status()
                 return response.text
         except FileNotFoundError:
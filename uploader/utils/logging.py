@@ -1,8 +1,15 @@
 import logging
 import queue
+from typing import Callable, Optional
 
 log_queue = queue.Queue()
 log_history = []
+_log_listener: Optional[Callable[[], None]] = None
+
+def set_log_listener(listener: Optional[Callable[[], None]]):
+    """Registers a callable that is invoked, from the logging thread, after each queued message."""
+    global _log_listener
+    _log_listener = listener
 
 class QueueHandler(logging.Handler):
     """A custom logging handler that puts messages into a queue."""
@@ -15,6 +22,18 @@ class QueueHandler(logging.Handler):
         log_history.append(message)
         self.log_queue.put(message)
 
+    def handle(self, record):
+        handled = super().handle(record)
+        # Notify outside the handler lock, as the listener may wait on the GUI thread
+        listener = _log_listener
+        if handled and listener is not None:
+            try:
+                listener()
+            except Exception:
+                # A failing listener (e.g. Tk already torn down) must not break the logging call
+                self.handleError(record)
+        return handled
+
 def setup_logging():
     """Configures the root logger."""
     logger = logging.getLogger()